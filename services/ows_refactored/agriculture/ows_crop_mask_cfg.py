@@ -1,4 +1,4 @@
-from ows_refactored.common.ows_reslim_cfg import reslim_alos_palsar
+from ows_refactored.common.ows_reslim_cfg import reslim_crop_mask
 
 bands_crop_mask = {"mask": [], "prob": [], "filtered": []}
 
@@ -185,7 +185,7 @@ This service is accessible through OGC Web Service (https://ows.digitalearth.afr
             "product_name": "crop_mask_eastern",
             "time_resolution": "year",
             "bands": bands_crop_mask,
-            "resource_limits": reslim_alos_palsar,
+            "resource_limits": reslim_crop_mask,
             "image_processing": {
                 "extent_mask_func": "datacube_ows.ogc_utils.mask_by_val",
                 "always_fetch_bands": [],
@@ -226,7 +226,7 @@ This service is accessible through OGC Web Service (https://ows.digitalearth.afr
             "product_name": "crop_mask_western",
             "time_resolution": "year",
             "bands": bands_crop_mask,
-            "resource_limits": reslim_alos_palsar,
+            "resource_limits": reslim_crop_mask,
             "image_processing": {
                 "extent_mask_func": "datacube_ows.ogc_utils.mask_by_val",
                 "always_fetch_bands": [],
@@ -267,7 +267,7 @@ This service is accessible through OGC Web Service (https://ows.digitalearth.afr
             "product_name": "crop_mask_northern",
             "time_resolution": "year",
             "bands": bands_crop_mask,
-            "resource_limits": reslim_alos_palsar,
+            "resource_limits": reslim_crop_mask,
             "image_processing": {
                 "extent_mask_func": "datacube_ows.ogc_utils.mask_by_val",
                 "always_fetch_bands": [],
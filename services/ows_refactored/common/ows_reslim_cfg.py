@@ -10,6 +10,25 @@ dataset_cache_rules = [
     },
 ]
 
+# For layers whose data does not change once published (DEMs, fixed-epoch
+# mosaics), so any tile with data can be cached long-term.
+dataset_cache_rules_static = [
+    {
+        "min_datasets": 1,
+        "max_age": 60 * 60 * 24 * 14,
+    },
+]
+
+# For summaries that are only recomputed when a new period is added (e.g.
+# WOfS all-time, and untimed annual requests that default to the latest
+# year), so tiles may be up to a day stale after each update.
+dataset_cache_rules_summary = [
+    {
+        "min_datasets": 1,
+        "max_age": 60 * 60 * 24,
+    },
+]
+
 reslim_wms_min_zoom_15 = {
     "wms": {
         "zoomed_out_fill_colour": [150, 180, 200, 160],
@@ -97,11 +116,24 @@ reslim_srtm = {
     },
 }
 
+reslim_static = {
+    "wms": {
+        "zoomed_out_fill_colour": [150, 180, 200, 160],
+        "min_zoom_factor": 10.0,
+        # "max_datasets": 16, # Defaults to no dataset limit
+        "dataset_cache_rules": dataset_cache_rules_static,
+    },
+    "wcs": {
+        # "max_datasets": 16, # Defaults to no dataset limit
+    },
+}
+
 reslim_wofs = {
     "wms": {
         "zoomed_out_fill_colour": [150, 180, 200, 160],
         "min_zoom_factor": 0.0,
         # "max_datasets": 16, # Defaults to no dataset limit
+        "dataset_cache_rules": dataset_cache_rules_summary,
     },
     "wcs": {
         # "max_datasets": 16, # Defaults to no dataset limit
@@ -129,6 +161,10 @@ reslim_wofs_dry = {
     },
 }
 
-reslim_alos_palsar = reslim_srtm
+reslim_dem = reslim_static
+
+reslim_alos_palsar = reslim_static
+
+reslim_io_lulc = reslim_static
 
-reslim_io_lulc = reslim_srtm
+reslim_crop_mask = reslim_srtm
@@ -1,8 +1,14 @@
 import numpy  # pylint: disable=import-error
 
 
+def _valid_mask(data, band):
+    # NaN is the only value not equal to itself, so a single comparison
+    # yields the "valid" mask without a separate isnan/negate pass.
+    return data[band] == data[band]
+
+
 def mask_by_nan(data, band):
-    return ~numpy.isnan(data[band])
+    return _valid_mask(data, band)
 
 
 def mask_by_emad_nan(data, band, band_mapper=None):
@@ -10,4 +16,104 @@ def mask_by_emad_nan(data, band, band_mapper=None):
         emad = band_mapper("EMAD")
     else:
         emad = "EMAD"
-    return ~numpy.isnan(data[emad])
+    return _valid_mask(data, emad)
+
+
+# Index functions. Each evaluates its expression in place in a single buffer,
+# rather than building a temporary per operator. By default they compute in
+# the precision index_expression and datacube_ows.band_utils would use
+# (float64 for integer bands, the band's own dtype for float bands), so
+# colour-ramp output is unchanged. A style may pass "dtype": "float32" in its
+# kwargs to halve memory per tile, at the cost of occasional +/-1 differences
+# in the ramp's 8-bit output. Setting INDEX_DTYPE changes the default for
+# every style that does not pass its own dtype.
+INDEX_DTYPE = None
+
+
+def _index_dtype(dtype, arr):
+    if dtype is None:
+        dtype = INDEX_DTYPE
+    if dtype is None:
+        if numpy.issubdtype(arr.dtype, numpy.floating):
+            return arr.dtype
+        return numpy.dtype(numpy.float64)
+    dtype = numpy.dtype(dtype)
+    if not numpy.issubdtype(dtype, numpy.floating):
+        raise ValueError("Index functions need a floating point dtype, not %s" % dtype)
+    return dtype
+
+
+def scale_offset(data, band, scale=1.0, offset=0.0, dtype=None, band_mapper=None):
+    # scale * band + offset
+    if band_mapper:
+        band = band_mapper(band)
+    values = data[band].values
+    out = values.astype(_index_dtype(dtype, values))
+    out *= scale
+    out += offset
+    return data[band].copy(data=out)
+
+
+def norm_diff_offset(data, band1, band2, offset=0.0, dtype=None, band_mapper=None):
+    # (band1 - band2) / (band1 + band2 + offset)
+    if band_mapper:
+        band1 = band_mapper(band1)
+        band2 = band_mapper(band2)
+    b1 = data[band1].values
+    b2 = data[band2].values
+    dtype = _index_dtype(dtype, b1)
+    out = b1.astype(dtype)
+    out -= b2
+    den = b1.astype(dtype)
+    den += b2
+    if offset:
+        den += offset
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        out /= den
+    return data[band1].copy(data=out)
+
+
+def norm_diff(data, band1, band2, dtype=None, band_mapper=None):
+    # Drop-in for datacube_ows.band_utils.norm_diff
+    return norm_diff_offset(data, band1, band2, dtype=dtype, band_mapper=band_mapper)
+
+
+def band_quotient(data, band1, band2, scale_from=None, scale_to=None, dtype=None, band_mapper=None):
+    # Drop-in for datacube_ows.band_utils.band_quotient, including its
+    # scale_from/scale_to rescaling for use as an rgb component.
+    if band_mapper:
+        band1 = band_mapper(band1)
+        band2 = band_mapper(band2)
+    values = data[band1].values
+    out = values.astype(_index_dtype(dtype, values))
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        out /= data[band2].values
+    if scale_from:
+        sc_min, sc_max = scale_from
+        tc_min, tc_max = scale_to or (0, 255)
+        numpy.clip(out, sc_min, sc_max, out=out)
+        # Same order of operations as datacube_ows.band_utils.scale_data,
+        # so the uint8 component output rounds identically.
+        out -= sc_min
+        out /= (sc_max - sc_min)
+        out *= (tc_max - tc_min)
+        out += tc_min
+    return data[band1].copy(data=out)
+
+
+def s1_dual_pol_rvi(data, band_vv, band_vh, dtype=None, band_mapper=None):
+    # 4 * vh / (vv + vh), the dual-pol RVI on backscatter power. Not the same
+    # as datacube_ows.band_utils.radar_vegetation_index, which works on
+    # amplitudes: 4 * hv^2 / (hh^2 + hv^2).
+    if band_mapper:
+        band_vv = band_mapper(band_vv)
+        band_vh = band_mapper(band_vh)
+    vh = data[band_vh].values
+    dtype = _index_dtype(dtype, vh)
+    out = vh.astype(dtype)
+    out *= 4
+    den = data[band_vv].values.astype(dtype)
+    den += vh
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        out /= den
+    return data[band_vh].copy(data=out)
@@ -1,4 +1,4 @@
-from ows_refactored.common.ows_reslim_cfg import reslim_srtm
+from ows_refactored.common.ows_reslim_cfg import reslim_dem
 
 bands_elevation = {
     "elevation": [],
@@ -89,7 +89,7 @@ This product is accessible through OGC Web Service (https://ows.digitalearth.afr
     "product_name": "srtm",
     "time_resolution": "year",
     "bands": bands_elevation,
-    "resource_limits": reslim_srtm,
+    "resource_limits": reslim_dem,
     "image_processing": {
         "extent_mask_func": "datacube_ows.ogc_utils.mask_by_val",
         "always_fetch_bands": [],
@@ -85,7 +85,7 @@ style_alos_hv_over_hh = {
         "red": {"hh": 1.0, "scale_range": [500, 10000]},
         "green": {"hv": 1.0, "scale_range": [200, 4000]},
         "blue": {
-            "function": "datacube_ows.band_utils.band_quotient",
+            "function": "ows_refactored.common.ows_util_tools.band_quotient",
             "mapped_bands": True,
             "kwargs": {"band1": "hv", "band2": "hh", "scale_from": [0.1, 1.0]},
         },
@@ -49,7 +49,7 @@ style_s1_vh_over_vv = {
         "red": {"vv": 1.0, "scale_range": [0.0, 0.28]},
         "green": {"vh": 1.0, "scale_range": [0.0, 0.06]},
         "blue": {
-            "function": "datacube_ows.band_utils.band_quotient",
+            "function": "ows_refactored.common.ows_util_tools.band_quotient",
             "mapped_bands": True,
             "kwargs": {"band1": "vh", "band2": "vv", "scale_from": [0.0, 0.49]},
         },
@@ -66,7 +66,12 @@ style_s1_rvi = {
     "name": "rvi",
     "title": "Radar Vegetation Index",
     "abstract": "Dual-pol radar vegetation index for Sentinel-1",
-    "index_expression": "4*vh/(vv + vh)",
+    "index_function": {
+        "function": "ows_refactored.common.ows_util_tools.s1_dual_pol_rvi",
+        "mapped_bands": True,
+        "kwargs": {"band_vv": "vv", "band_vh": "vh"},
+    },
+    "needed_bands": ["vv", "vh"],
     "mpl_ramp": "YlGnBu_r",
     "range": [0.0, 1.0],
     "legend": {
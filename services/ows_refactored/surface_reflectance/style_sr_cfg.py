@@ -53,7 +53,7 @@ style_ls_ndvi = {
     "title": "NDVI - Red, NIR",
     "abstract": "Normalised Difference Vegetation Index - a derived index that correlates well with the existence of vegetation",
     "index_function": {
-        "function": "datacube_ows.band_utils.norm_diff",
+        "function": "ows_refactored.common.ows_util_tools.norm_diff",
         "mapped_bands": True,
         "kwargs": {"band1": "nir", "band2": "red"},
     },
@@ -103,7 +103,7 @@ style_ls_ndwi = {
     "title": "NDWI - Green, NIR",
     "abstract": "Normalised Difference Water Index - a derived index that correlates well with the existence of water (McFeeters 1996)",
     "index_function": {
-        "function": "datacube_ows.band_utils.norm_diff",
+        "function": "ows_refactored.common.ows_util_tools.norm_diff",
         "mapped_bands": True,
         "kwargs": {"band1": "green", "band2": "nir"},
     },
@@ -159,7 +159,7 @@ style_gals_mndwi = {
     "title": "MNDWI - Green, SWIR",
     "abstract": "Modified Normalised Difference Water Index - a derived index that correlates well with the existence of water (Xu 2006)",
     "index_function": {
-        "function": "datacube_ows.band_utils.norm_diff",
+        "function": "ows_refactored.common.ows_util_tools.norm_diff",
         "mapped_bands": True,
         "kwargs": {"band1": "green", "band2": "swir_1"},
     },
@@ -205,7 +205,7 @@ style_ls_mndwi = {
     "abstract": "Modified Normalised Difference Water Index - a derived index that correlates "
     "well with the existence of water (Xu 2006)",
     "index_function": {
-        "function": "datacube_ows.band_utils.norm_diff",
+        "function": "ows_refactored.common.ows_util_tools.norm_diff",
         "mapped_bands": True,
         "kwargs": {"band1": "green", "band2": "swir1"},
     },
@@ -1068,7 +1068,12 @@ style_lsc2_sr_ndvi = {
     "name": "ndvi",
     "title": "NDVI - Red, NIR",
     "abstract": "Normalised Difference Vegetation Index - a derived index that correlates well with the existence of vegetation",
-    "index_expression": "(nir*1.0-red)/(nir+red-14545.4545)",
+    "index_function": {
+        "function": "ows_refactored.common.ows_util_tools.norm_diff_offset",
+        "mapped_bands": True,
+        "kwargs": {"band1": "nir", "band2": "red", "offset": -14545.4545},
+    },
+    "needed_bands": ["nir", "red"],
     "color_ramp": [
         {"value": -0.0, "color": "#8F3F20", "alpha": 0.0},
         {"value": 0.0, "color": "#8F3F20", "alpha": 1.0},
@@ -1090,7 +1095,12 @@ style_lsc2_sr_ndwi = {
     "name": "ndwi",
     "title": "NDWI - Green, NIR",
     "abstract": "Normalised Difference Water Index - a derived index that correlates well with the existence of water (McFeeters 1996)",
-    "index_expression": "(green*1.0-nir)/(green+nir-14545.4545)",
+    "index_function": {
+        "function": "ows_refactored.common.ows_util_tools.norm_diff_offset",
+        "mapped_bands": True,
+        "kwargs": {"band1": "green", "band2": "nir", "offset": -14545.4545},
+    },
+    "needed_bands": ["green", "nir"],
     "color_ramp": [
         {"value": -0.1, "color": "#f7fbff", "alpha": 0.0},
         {"value": 0.0, "color": "#d8e7f5", "legend": {"prefix": "<"}},
@@ -1119,7 +1129,12 @@ style_lsc2_sr_mndwi = {
     "title": "MNDWI - Green, SWIR",
     "abstract": "Modified Normalised Difference Water Index - a derived index that correlates "
     "well with the existence of water (Xu 2006)",
-    "index_expression": "(green*1.0-swir_1)/(green+swir_1-14545.4545)",
+    "index_function": {
+        "function": "ows_refactored.common.ows_util_tools.norm_diff_offset",
+        "mapped_bands": True,
+        "kwargs": {"band1": "green", "band2": "swir_1", "offset": -14545.4545},
+    },
+    "needed_bands": ["green", "swir_1"],
     "color_ramp": [
         {"value": -0.1, "color": "#f7fbff", "alpha": 0.0},
         {"value": 0.0, "color": "#d8e7f5"},
@@ -20,7 +20,12 @@ style_lsc2_st = {
     "name": "surface_temperature",
     "title": "Surface temperature - Celsius",
     "abstract": "Surface temperature in degrees Celsius",
-    "index_expression": "(0.00341802*st - 124.15)",
+    "index_function": {
+        "function": "ows_refactored.common.ows_util_tools.scale_offset",
+        "mapped_bands": True,
+        "kwargs": {"band": "st", "scale": 0.00341802, "offset": -124.15},
+    },
+    "needed_bands": ["st"],
     "mpl_ramp": "magma",
     "range": [0.0, 50.0],
     "legend": {
@@ -43,7 +48,12 @@ style_lsc2_st_masked = {
     "name": "surface_temperature_masked",
     "title": "Surface temperature (cloud masked) - Celsius",
     "abstract": "Surface temperature in degrees Celsius",
-    "index_expression": "(0.00341802*st - 124.15)",
+    "index_function": {
+        "function": "ows_refactored.common.ows_util_tools.scale_offset",
+        "mapped_bands": True,
+        "kwargs": {"band": "st", "scale": 0.00341802, "offset": -124.15},
+    },
+    "needed_bands": ["st"],
     "mpl_ramp": "magma",
     "range": [0.0, 50.0],
     "pq_masks": [
@@ -74,7 +84,12 @@ style_lsc2_st_masked_ls8 = {
     "name": "surface_temperature_masked",
     "title": "Surface temperature (cloud masked) - Celsius",
     "abstract": "Surface temperature in degrees Celsius",
-    "index_expression": "(0.00341802*st - 124.15)",
+    "index_function": {
+        "function": "ows_refactored.common.ows_util_tools.scale_offset",
+        "mapped_bands": True,
+        "kwargs": {"band": "st", "scale": 0.00341802, "offset": -124.15},
+    },
+    "needed_bands": ["st"],
     "mpl_ramp": "magma",
     "range": [0.0, 50.0],
     "pq_masks": [
@@ -106,7 +121,12 @@ style_lsc2_st_qa = {
     "name": "surface_temperature_uncertainty",
     "title": "Surface temperature uncertainty - Celsius",
     "abstract": "Surface temperature uncertainty in degrees Celsius",
-    "index_expression": "(0.01*st_qa)",
+    "index_function": {
+        "function": "ows_refactored.common.ows_util_tools.scale_offset",
+        "mapped_bands": True,
+        "kwargs": {"band": "st_qa", "scale": 0.01},
+    },
+    "needed_bands": ["st_qa"],
     "mpl_ramp": "viridis",
     "range": [0.0, 6.0],
     "legend": {
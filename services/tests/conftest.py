@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make ows_refactored importable the same way OWS sees it (PYTHONPATH=services).
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))